@@ -5,24 +5,31 @@ Provides login, registration, token refresh, and user profile
 endpoints with JWT-based authentication.
 """
 
+import uuid
 from datetime import timedelta
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from pydantic import BaseModel, EmailStr
+from redis.asyncio import Redis
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
 from app.database import get_db
 from app.models.user import User
+from app.core.cache import DASHBOARD_STATS_KEY, cache_delete, get_redis
 from app.core.security import (
+    DUMMY_PASSWORD_HASH,
     verify_password,
     get_password_hash,
+    password_needs_rehash,
     create_access_token,
     create_refresh_token,
-    get_current_user,
+    UserView,
+    get_current_user_view,
 )
 
 router = APIRouter()
@@ -38,7 +45,7 @@ class UserCreate(BaseModel):
 
 class UserResponse(BaseModel):
     """Schema for user response data."""
-    id: str
+    id: uuid.UUID
     username: str
     email: str
     full_name: str | None
@@ -60,6 +67,7 @@ class TokenResponse(BaseModel):
 async def register(
     user_data: UserCreate,
     db: AsyncSession = Depends(get_db),
+    redis: Redis | None = Depends(get_redis),
 ):
     """
     Register a new user account.
@@ -68,37 +76,35 @@ async def register(
     - Hashes password before storage
     - Returns created user profile
     """
-    # Check existing user
+    # Insert unless username or email is taken, in a single round trip
     result = await db.execute(
-        select(User).where(
-            (User.username == user_data.username) | (User.email == user_data.email)
+        insert(User)
+        .values(
+            username=user_data.username,
+            email=user_data.email,
+            hashed_password=await get_password_hash(user_data.password),
+            full_name=user_data.full_name,
         )
+        .on_conflict_do_nothing()
+        .returning(User)
     )
-    if result.scalar_one_or_none():
+    new_user = result.scalar_one_or_none()
+    if new_user is None:
+        # Only the failure path pays for working out which field collided
+        taken = await db.execute(
+            select(User.id).where(User.username == user_data.username)
+        )
+        field = "Username" if taken.first() else "Email"
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
-            detail="Username or email already registered",
+            detail=f"{field} already registered",
         )
 
-    # Create new user
-    new_user = User(
-        username=user_data.username,
-        email=user_data.email,
-        hashed_password=get_password_hash(user_data.password),
-        full_name=user_data.full_name,
-    )
-    db.add(new_user)
-    await db.flush()
-    await db.refresh(new_user)
-
-    return UserResponse(
-        id=str(new_user.id),
-        username=new_user.username,
-        email=new_user.email,
-        full_name=new_user.full_name,
-        role=new_user.role,
-        is_active=new_user.is_active,
-    )
+    # Commit before invalidating so /stats cannot re-cache the old counts
+    await db.commit()
+    await cache_delete(redis, DASHBOARD_STATS_KEY)
+
+    return new_user
 
 
 @router.post("/login", response_model=TokenResponse)
@@ -117,7 +123,12 @@ async def login(
     )
     user = result.scalar_one_or_none()
 
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    # Always pay for one hash comparison, even for unknown usernames
+    password_ok = await verify_password(
+        form_data.password,
+        user.hashed_password if user else DUMMY_PASSWORD_HASH,
+    )
+    if user is None or not password_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -130,6 +141,10 @@ async def login(
             detail="Account is deactivated",
         )
 
+    # Transparently migrate legacy bcrypt hashes to argon2id
+    if password_needs_rehash(user.hashed_password):
+        user.hashed_password = await get_password_hash(form_data.password)
+
     access_token = create_access_token(
         data={"sub": str(user.id), "role": user.role},
         expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
@@ -142,13 +157,6 @@ async def login(
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_profile(current_user: User = Depends(get_current_user)):
+async def get_profile(current_user: UserView = Depends(get_current_user_view)):
     """Get the current authenticated user's profile."""
-    return UserResponse(
-        id=str(current_user.id),
-        username=current_user.username,
-        email=current_user.email,
-        full_name=current_user.full_name,
-        role=current_user.role,
-        is_active=current_user.is_active,
-    )
\ No newline at end of file
+    return current_user
\ No newline at end of file
@@ -5,16 +5,25 @@ Provides aggregated statistics and data for the admin dashboard,
 including user counts, activity logs, and system metrics.
 """
 
+import time
 from datetime import datetime, timedelta
 
 from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel
-from sqlalchemy import select, func
+from sqlalchemy import bindparam, select, func
+from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.models.user import User
-from app.core.security import get_current_user, require_role
+from app.core.cache import (
+    DASHBOARD_STATS_KEY,
+    DASHBOARD_STATS_TTL,
+    cache_get,
+    cache_set,
+    get_redis,
+)
+from app.core.security import UserView, get_current_user_view, require_role
 
 router = APIRouter()
 
@@ -35,44 +44,70 @@ class SystemInfo(BaseModel):
     cache_status: str
 
 
-_start_time = datetime.utcnow()
+_start_time = time.monotonic()
+
+# Statements are built once so each request reuses SQLAlchemy's compiled
+# cache entry and asyncpg's prepared statement; only parameters vary.
+_STATS_STMT = select(
+    func.count(User.id),
+    func.count(User.id).filter(User.is_active == True),
+    func.count(User.id).filter(User.created_at >= bindparam("today")),
+    func.count(User.id).filter(User.role == "admin"),
+)
+
+_LIST_USERS_STMT = (
+    select(
+        User.id,
+        User.username,
+        User.email,
+        User.role,
+        User.is_active,
+        User.created_at,
+        func.count().over().label("total"),
+    )
+    .order_by(User.created_at.desc())
+    .offset(bindparam("offset"))
+    .limit(bindparam("limit"))
+)
+
+_USER_COUNT_STMT = select(func.count(User.id))
 
 
 @router.get("/stats", response_model=DashboardStats)
 async def get_dashboard_stats(
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    redis: Redis | None = Depends(get_redis),
+    current_user: UserView = Depends(get_current_user_view),
 ):
     """
     Retrieve aggregated dashboard statistics.
     
     Requires authenticated user. Returns user counts
     and activity metrics for the dashboard overview.
+    Results are cached in Redis for a short TTL.
     """
+    cached = await cache_get(redis, DASHBOARD_STATS_KEY)
+    if cached:
+        return DashboardStats.model_validate_json(cached)
+
     today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
 
-    total = await db.execute(select(func.count(User.id)))
-    active = await db.execute(
-        select(func.count(User.id)).where(User.is_active == True)
-    )
-    new_today = await db.execute(
-        select(func.count(User.id)).where(User.created_at >= today)
-    )
-    admins = await db.execute(
-        select(func.count(User.id)).where(User.role == "admin")
-    )
+    result = await db.execute(_STATS_STMT, {"today": today})
+    total, active, new_today, admins = result.one()
 
-    return DashboardStats(
-        total_users=total.scalar() or 0,
-        active_users=active.scalar() or 0,
-        new_users_today=new_today.scalar() or 0,
-        admin_count=admins.scalar() or 0,
+    stats = DashboardStats(
+        total_users=total or 0,
+        active_users=active or 0,
+        new_users_today=new_today or 0,
+        admin_count=admins or 0,
     )
+    await cache_set(redis, DASHBOARD_STATS_KEY, DASHBOARD_STATS_TTL, stats.model_dump_json())
+    return stats
 
 
 @router.get("/system", response_model=SystemInfo)
 async def get_system_info(
-    current_user: User = Depends(require_role("admin")),
+    current_user: UserView = Depends(require_role("admin")),
 ):
     """
     Retrieve system health information.
@@ -80,7 +115,7 @@ async def get_system_info(
     Admin-only endpoint that returns server status,
     uptime, and service connectivity information.
     """
-    uptime = (datetime.utcnow() - _start_time).total_seconds() / 3600
+    uptime = (time.monotonic() - _start_time) / 3600
 
     return SystemInfo(
         server_time=datetime.utcnow().isoformat(),
@@ -95,7 +130,7 @@ async def list_users(
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_role("admin")),
+    current_user: UserView = Depends(require_role("admin")),
 ):
     """
     List all users with pagination. Admin only.
@@ -105,28 +140,29 @@ async def list_users(
         per_page: Number of items per page (max 100)
     """
     offset = (page - 1) * per_page
-    result = await db.execute(
-        select(User)
-        .order_by(User.created_at.desc())
-        .offset(offset)
-        .limit(per_page)
-    )
-    users = result.scalars().all()
-
-    total_result = await db.execute(select(func.count(User.id)))
-    total = total_result.scalar() or 0
+    result = await db.execute(_LIST_USERS_STMT, {"offset": offset, "limit": per_page})
+    rows = result.all()
+
+    if rows:
+        total = rows[0].total
+    elif offset:
+        # Page past the end: the window count has no row to ride on
+        total_result = await db.execute(_USER_COUNT_STMT)
+        total = total_result.scalar() or 0
+    else:
+        total = 0
 
     return {
         "items": [
             {
-                "id": str(u.id),
-                "username": u.username,
-                "email": u.email,
-                "role": u.role,
-                "is_active": u.is_active,
-                "created_at": u.created_at.isoformat() if u.created_at else None,
+                "id": str(row.id),
+                "username": row.username,
+                "email": row.email,
+                "role": row.role,
+                "is_active": row.is_active,
+                "created_at": row.created_at.isoformat() if row.created_at else None,
             }
-            for u in users
+            for row in rows
         ],
         "total": total,
         "page": page,
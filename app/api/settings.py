@@ -1,12 +1,25 @@
 """System settings API endpoints."""
 
+import json
+import logging
+import time
+
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
 from typing import Optional, Dict, Any
 from datetime import datetime
 
+from app.core.cache import cache_get, get_redis
+
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/api/settings", tags=["settings"])
 
+SETTINGS_KEY = "cfg:system:v1"
+SETTINGS_LOCAL_TTL = 5.0
+
 
 class SystemSettings(BaseModel):
     site_name: str = Field(default="Admin Dashboard")
@@ -19,21 +32,46 @@ class SystemSettings(BaseModel):
     notification_email: Optional[str] = None
 
 
+# Per-worker copy of the settings held in Redis, refreshed after
+# SETTINGS_LOCAL_TTL seconds, so other workers see an update within that window
 _settings_store: Dict[str, Any] = SystemSettings().dict()
+_settings_loaded_at: float = 0.0
+
+
+async def _load_settings(redis: Optional[Redis]) -> Dict[str, Any]:
+    global _settings_store, _settings_loaded_at
+    if time.monotonic() - _settings_loaded_at < SETTINGS_LOCAL_TTL:
+        return _settings_store
+    cached = await cache_get(redis, SETTINGS_KEY)
+    if cached:
+        _settings_store = json.loads(cached)
+    _settings_loaded_at = time.monotonic()
+    return _settings_store
 
 
 @router.get("/")
-async def get_settings():
+async def get_settings(redis: Optional[Redis] = Depends(get_redis)):
     return {
-        "settings": _settings_store,
+        "settings": await _load_settings(redis),
         "last_updated": datetime.utcnow().isoformat(),
     }
 
 
 @router.put("/")
-async def update_settings(settings: SystemSettings):
-    global _settings_store
-    _settings_store = settings.dict()
+async def update_settings(
+    settings: SystemSettings,
+    redis: Optional[Redis] = Depends(get_redis),
+):
+    global _settings_store, _settings_loaded_at
+    data = settings.dict()
+    if redis is not None:
+        try:
+            await redis.set(SETTINGS_KEY, json.dumps(data))
+        except RedisError as exc:
+            logger.error(f"Failed to persist settings: {exc}")
+            raise HTTPException(status_code=503, detail="Settings store unavailable")
+    _settings_store = data
+    _settings_loaded_at = time.monotonic()
     return {
         "message": "Settings updated successfully",
         "settings": _settings_store,
@@ -1,13 +1,17 @@
 """User management API endpoints."""
 
+import uuid
+
 from fastapi import APIRouter, Depends, HTTPException, Query
+from redis.asyncio import Redis
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime
 
 from app.database import get_db
 from app.models.user import User
-from app.core.security import get_current_admin_user
+from app.core.cache import DASHBOARD_STATS_KEY, cache_delete, get_redis, user_cache_key
+from app.core.security import UserView, get_current_admin_user
 
 router = APIRouter(prefix="/api/users", tags=["users"])
 
@@ -19,7 +23,7 @@ async def list_users(
     search: Optional[str] = None,
     role: Optional[str] = None,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_admin_user),
+    current_user: UserView = Depends(get_current_admin_user),
 ):
     query = db.query(User)
     if search:
@@ -43,9 +47,9 @@ async def list_users(
 
 @router.get("/{user_id}")
 async def get_user(
-    user_id: int,
+    user_id: uuid.UUID,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_admin_user),
+    current_user: UserView = Depends(get_current_admin_user),
 ):
     user = db.query(User).filter(User.id == user_id).first()
     if not user:
@@ -55,10 +59,11 @@ async def get_user(
 
 @router.put("/{user_id}/role")
 async def update_user_role(
-    user_id: int,
+    user_id: uuid.UUID,
     role: str,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_admin_user),
+    redis: Optional[Redis] = Depends(get_redis),
+    current_user: UserView = Depends(get_current_admin_user),
 ):
     user = db.query(User).filter(User.id == user_id).first()
     if not user:
@@ -68,14 +73,16 @@ async def update_user_role(
     user.role = role
     user.updated_at = datetime.utcnow()
     db.commit()
+    await cache_delete(redis, DASHBOARD_STATS_KEY, user_cache_key(user.id))
     return {"message": "Role updated", "user_id": user_id, "new_role": role}
 
 
 @router.delete("/{user_id}")
 async def delete_user(
-    user_id: int,
+    user_id: uuid.UUID,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_admin_user),
+    redis: Optional[Redis] = Depends(get_redis),
+    current_user: UserView = Depends(get_current_admin_user),
 ):
     if user_id == current_user.id:
         raise HTTPException(status_code=400, detail="Cannot delete yourself")
@@ -84,4 +91,5 @@ async def delete_user(
         raise HTTPException(status_code=404, detail="User not found")
     db.delete(user)
     db.commit()
+    await cache_delete(redis, DASHBOARD_STATS_KEY, user_cache_key(user.id))
     return {"message": "User deleted", "user_id": user_id}
\ No newline at end of file
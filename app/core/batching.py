@@ -0,0 +1,56 @@
+"""
+Batch lookup helpers.
+
+Use these instead of issuing one SELECT per item when an endpoint needs
+several users at once (bulk role updates, audit log entries joined to
+their authors, etc.): collect the ids first, fetch them in a single
+``WHERE id IN (...)`` query, then resolve each item from the returned dict.
+"""
+
+from typing import Any, Dict, Iterable
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user import User
+
+
+async def batch_fetch_users(session: AsyncSession, ids: Iterable) -> Dict[Any, User]:
+    """
+    Load many users with a single query.
+
+    Args:
+        session: Active database session.
+        ids: User ids to load; duplicates are ignored.
+
+    Returns:
+        Mapping of user id to User. Unknown ids are simply absent.
+    """
+    ids = set(ids)
+    if not ids:
+        return {}
+    result = await session.execute(select(User).where(User.id.in_(ids)))
+    return {user.id: user for user in result.scalars()}
+
+
+async def batch_fetch_user_columns(
+    session: AsyncSession, ids: Iterable, *columns
+) -> Dict[Any, Any]:
+    """
+    Load selected columns for many users without building ORM objects.
+
+    Args:
+        session: Active database session.
+        ids: User ids to load; duplicates are ignored.
+        columns: User columns to fetch, e.g. ``User.username``.
+
+    Returns:
+        Mapping of user id to a Row with the requested columns.
+    """
+    ids = set(ids)
+    if not ids:
+        return {}
+    result = await session.execute(
+        select(User.id, *columns).where(User.id.in_(ids))
+    )
+    return {row.id: row for row in result}
@@ -0,0 +1,73 @@
+"""Redis cache helpers shared by API endpoints and dependencies."""
+
+import logging
+from typing import Optional
+
+from fastapi import Request
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+DASHBOARD_STATS_KEY = "dash:stats:v1"
+DASHBOARD_STATS_TTL = 60
+USER_CACHE_TTL = 30
+
+
+def create_redis() -> Redis:
+    """
+    Create the application-wide Redis client (connects lazily).
+
+    Short socket timeouts make an unresponsive Redis raise a RedisError
+    quickly, so the cache helpers below fall back to the database instead
+    of waiting for the OS TCP timeout.
+    """
+    return Redis.from_url(
+        settings.REDIS_URL,
+        decode_responses=True,
+        socket_connect_timeout=settings.REDIS_CONNECT_TIMEOUT,
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+    )
+
+
+def user_cache_key(user_id) -> str:
+    """Key under which the authenticated-user snapshot is cached."""
+    return f"u:{user_id}"
+
+
+def get_redis(request: Request) -> Optional[Redis]:
+    """Dependency returning the Redis client stored on app state, if any."""
+    return getattr(request.app.state, "redis", None)
+
+
+async def cache_get(redis: Optional[Redis], key: str) -> Optional[str]:
+    """Read a cached value, treating Redis failures as a cache miss."""
+    if redis is None:
+        return None
+    try:
+        return await redis.get(key)
+    except RedisError as exc:
+        logger.warning(f"Cache read failed for {key}: {exc}")
+        return None
+
+
+async def cache_set(redis: Optional[Redis], key: str, ttl: int, value: str) -> None:
+    """Store a value with a TTL, ignoring Redis failures."""
+    if redis is None:
+        return
+    try:
+        await redis.setex(key, ttl, value)
+    except RedisError as exc:
+        logger.warning(f"Cache write failed for {key}: {exc}")
+
+
+async def cache_delete(redis: Optional[Redis], *keys: str) -> None:
+    """Invalidate one or more keys, ignoring Redis failures."""
+    if redis is None or not keys:
+        return
+    try:
+        await redis.delete(*keys)
+    except RedisError as exc:
+        logger.warning(f"Cache invalidation failed for {keys}: {exc}")
@@ -1,67 +1,87 @@
 """Application middleware for logging, CORS, and request tracking."""
 
+import os
 import time
-import uuid
 import logging
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
 
-class RequestTrackingMiddleware(BaseHTTPMiddleware):
-    """Add unique request ID and track request duration."""
+class UnifiedMiddleware:
+    """
+    Request tracking, maintenance mode and security headers as one ASGI layer.
 
-    async def dispatch(self, request: Request, call_next):
-        request_id = str(uuid.uuid4())[:8]
-        start_time = time.time()
+    Adds a unique request ID and the request duration to every response,
+    blocks requests while maintenance mode is enabled, and sets the
+    standard security headers in a single pass over the response start.
+    """
 
-        request.state.request_id = request_id
-        logger.info(
-            f"[{request_id}] {request.method} {request.url.path} "
-            f"from {request.client.host}"
-        )
+    # Paths still served during maintenance: exact matches plus whole subtrees
+    ALLOWED_EXACT = frozenset({"/health", "/api/v1/auth/login", "/api/settings"})
+    ALLOWED_PREFIXES = ("/api/settings/",)
 
-        response = await call_next(request)
+    SECURITY_HEADERS = [
+        (b"x-content-type-options", b"nosniff"),
+        (b"x-frame-options", b"DENY"),
+        (b"x-xss-protection", b"1; mode=block"),
+        (b"strict-transport-security", b"max-age=31536000; includeSubDomains"),
+    ]
 
-        duration = time.time() - start_time
-        response.headers["X-Request-ID"] = request_id
-        response.headers["X-Response-Time"] = f"{duration:.4f}s"
+    MAINTENANCE_BODY = b'{"error": "Service under maintenance"}'
 
-        logger.info(
-            f"[{request_id}] Completed {response.status_code} in {duration:.4f}s"
-        )
-        return response
-
-
-class MaintenanceModeMiddleware(BaseHTTPMiddleware):
-    """Block requests when maintenance mode is enabled."""
-
-    ALLOWED_PATHS = {"/health", "/api/auth/login", "/api/settings"}
-
-    def __init__(self, app, enabled: bool = False):
-        super().__init__(app)
+    def __init__(self, app: ASGIApp, enabled: bool = False):
+        self.app = app
         self.enabled = enabled
 
-    async def dispatch(self, request: Request, call_next):
-        if self.enabled and request.url.path not in self.ALLOWED_PATHS:
-            return Response(
-                content='{"error": "Service under maintenance"}',
-                status_code=503,
-                media_type="application/json",
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = os.urandom(4).hex()
+        start_time = time.perf_counter()
+        log_enabled = logger.isEnabledFor(logging.INFO)
+        path = scope["path"]
+
+        scope.setdefault("state", {})["request_id"] = request_id
+        if log_enabled:
+            client = scope.get("client")
+            logger.info(
+                f"[{request_id}] {scope['method']} {path} "
+                f"from {client[0] if client else 'unknown'}"
             )
-        return await call_next(request)
-
-
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """Add security headers to all responses."""
 
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Strict-Transport-Security"] = (
-            "max-age=31536000; includeSubDomains"
-        )
-        return response
\ No newline at end of file
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                duration = time.perf_counter() - start_time
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    *self.SECURITY_HEADERS,
+                    (b"x-request-id", request_id.encode()),
+                    (b"x-response-time", f"{duration:.4f}s".encode()),
+                ]
+                if log_enabled:
+                    logger.info(
+                        f"[{request_id}] Completed {message['status']} in {duration:.4f}s"
+                    )
+            await send(message)
+
+        if self.enabled and not (
+            path in self.ALLOWED_EXACT or path.startswith(self.ALLOWED_PREFIXES)
+        ):
+            await send_wrapper({
+                "type": "http.response.start",
+                "status": 503,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(self.MAINTENANCE_BODY)).encode()),
+                ],
+            })
+            await send_wrapper({
+                "type": "http.response.body",
+                "body": self.MAINTENANCE_BODY,
+            })
+            return
+
+        await self.app(scope, receive, send_wrapper)
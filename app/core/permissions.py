@@ -1,20 +1,23 @@
 """Role-based access control (RBAC) permission system."""
 
-from enum import Enum
-from typing import Set, Dict
-from functools import wraps
+from enum import Enum, IntFlag
+from functools import reduce, wraps
+from operator import or_
+from typing import FrozenSet, Dict
 from fastapi import HTTPException, Depends
 
+from app.core.security import UserView, get_current_user_view
 
-class Permission(str, Enum):
-    VIEW_DASHBOARD = "view_dashboard"
-    MANAGE_USERS = "manage_users"
-    EDIT_SETTINGS = "edit_settings"
-    VIEW_LOGS = "view_logs"
-    MANAGE_CONTENT = "manage_content"
-    EXPORT_DATA = "export_data"
-    DELETE_RECORDS = "delete_records"
-    MANAGE_ROLES = "manage_roles"
+
+class Permission(IntFlag):
+    VIEW_DASHBOARD = 1 << 0
+    MANAGE_USERS = 1 << 1
+    EDIT_SETTINGS = 1 << 2
+    VIEW_LOGS = 1 << 3
+    MANAGE_CONTENT = 1 << 4
+    EXPORT_DATA = 1 << 5
+    DELETE_RECORDS = 1 << 6
+    MANAGE_ROLES = 1 << 7
 
 
 class Role(str, Enum):
@@ -23,46 +26,69 @@ class Role(str, Enum):
     VIEWER = "viewer"
 
 
-ROLE_PERMISSIONS: Dict[Role, Set[Permission]] = {
-    Role.ADMIN: set(Permission),
-    Role.EDITOR: {
-        Permission.VIEW_DASHBOARD,
-        Permission.MANAGE_CONTENT,
-        Permission.VIEW_LOGS,
-        Permission.EXPORT_DATA,
-    },
-    Role.VIEWER: {
-        Permission.VIEW_DASHBOARD,
-        Permission.VIEW_LOGS,
-    },
+ROLE_PERMISSIONS: Dict[Role, Permission] = {
+    Role.ADMIN: reduce(or_, Permission),
+    Role.EDITOR: (
+        Permission.VIEW_DASHBOARD
+        | Permission.MANAGE_CONTENT
+        | Permission.VIEW_LOGS
+        | Permission.EXPORT_DATA
+    ),
+    Role.VIEWER: Permission.VIEW_DASHBOARD | Permission.VIEW_LOGS,
+}
+
+
+# Role name -> permission mask, so a check is a single integer AND
+_ROLE_MASK: Dict[str, Permission] = {
+    role.value: mask for role, mask in ROLE_PERMISSIONS.items()
 }
+_NO_PERMISSIONS = Permission(0)
+
+# Role name -> individual permissions, for callers that list them
+_ROLE_PERMISSIONS: Dict[str, FrozenSet[Permission]] = {
+    role: frozenset(p for p in Permission if mask & p)
+    for role, mask in _ROLE_MASK.items()
+}
+_EMPTY: FrozenSet[Permission] = frozenset()
+
+
+def has_all_permissions(role: str, permissions: Permission) -> bool:
+    """Check if a role has every permission in a combined mask."""
+    return (_ROLE_MASK.get(role, _NO_PERMISSIONS) & permissions) == permissions
+
+
+def has_any_permission(role: str, permissions: Permission) -> bool:
+    """Check if a role has at least one permission in a combined mask."""
+    return bool(_ROLE_MASK.get(role, _NO_PERMISSIONS) & permissions)
 
 
 def has_permission(role: str, permission: Permission) -> bool:
-    """Check if a role has a specific permission."""
-    try:
-        role_enum = Role(role)
-    except ValueError:
-        return False
-    return permission in ROLE_PERMISSIONS.get(role_enum, set())
+    """Check if a role has a specific permission (single-flag alias)."""
+    return has_any_permission(role, permission)
 
 
-def get_user_permissions(role: str) -> Set[Permission]:
+def get_user_permissions(role: str) -> FrozenSet[Permission]:
     """Get all permissions for a given role."""
-    try:
-        role_enum = Role(role)
-    except ValueError:
-        return set()
-    return ROLE_PERMISSIONS.get(role_enum, set())
+    return _ROLE_PERMISSIONS.get(role, _EMPTY)
 
 
 def require_permission(permission: Permission):
-    """Dependency that checks if the current user has the required permission."""
-    def dependency(current_user=Depends()):
-        if not has_permission(current_user.role, permission):
+    """
+    Dependency that checks if the current user has the required permission.
+
+    Several permissions may be combined with ``|``; all of them are required.
+
+    Raises:
+        ValueError: If the mask is empty, which would grant access to everyone.
+    """
+    if not permission:
+        raise ValueError("require_permission needs at least one permission")
+
+    def dependency(current_user: UserView = Depends(get_current_user_view)):
+        if not has_all_permissions(current_user.role, permission):
             raise HTTPException(
                 status_code=403,
-                detail=f"Permission denied: {permission.value} required",
+                detail=f"Permission denied: {permission.name.lower()} required",
             )
         return current_user
     return dependency
\ No newline at end of file
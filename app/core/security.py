@@ -5,34 +5,110 @@ Provides JWT token creation/validation, password hashing,
 and authentication dependencies for route protection.
 """
 
+import asyncio
+import hashlib
+import json
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
+import bcrypt
+import jwt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from redis.asyncio import Redis
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
-from app.database import get_db
+from app.database import async_session_factory, get_db
+from app.core.cache import USER_CACHE_TTL, cache_get, cache_set, get_redis, user_cache_key
 
-# Password hashing context using bcrypt
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hasher using argon2id
+password_hasher = PasswordHasher(memory_cost=65536, time_cost=3, parallelism=2)
+
+# Legacy bcrypt hashes still verify and are upgraded on the next successful login.
+# bcrypt only ever saw the first 72 bytes of a password, so that is all we
+# compare; argon2id has no such limit and needs no pre-hashing.
+_BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+_BCRYPT_MAX_BYTES = 72
+
+# Verified against when a login names an unknown user so that response
+# time does not reveal whether the username exists
+DUMMY_PASSWORD_HASH = password_hasher.hash("not-a-real-password")
+
+# Dedicated pool for hashing so a login flood queues here instead of taking
+# every default executor thread, capping argon2 memory per worker
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash"
+)
+
+# Verified token payloads keyed by a digest of the raw token, with their expiry
+_decode_cache: Dict[bytes, Tuple[float, dict]] = {}
+_DECODE_CACHE_MAX_SIZE = 10_000
 
 # OAuth2 scheme for extracting bearer tokens
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a plain password against its hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+def _credentials_exception() -> HTTPException:
+    """Error raised whenever the bearer token cannot be tied to a user."""
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+@dataclass(slots=True, frozen=True)
+class UserView:
+    """Read-only snapshot of the authenticated user, safe to cache."""
+    id: uuid.UUID
+    username: str
+    email: str
+    full_name: Optional[str]
+    role: str
+    is_active: bool
 
 
-def get_password_hash(password: str) -> str:
-    """Generate a bcrypt hash of the given password."""
-    return pwd_context.hash(password)
+def _check_password(plain_password: str, hashed_password: str) -> bool:
+    if hashed_password.startswith(_BCRYPT_PREFIXES):
+        try:
+            return bcrypt.checkpw(
+                plain_password.encode()[:_BCRYPT_MAX_BYTES], hashed_password.encode()
+            )
+        except ValueError:
+            return False
+    try:
+        return password_hasher.verify(hashed_password, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a plain password against its hash on the hashing pool."""
+    return await asyncio.get_running_loop().run_in_executor(
+        _hash_executor, _check_password, plain_password, hashed_password
+    )
+
+
+async def get_password_hash(password: str) -> str:
+    """Generate an argon2id hash of the given password on the hashing pool."""
+    return await asyncio.get_running_loop().run_in_executor(
+        _hash_executor, password_hasher.hash, password
+    )
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Check whether a stored hash uses a deprecated scheme or parameters."""
+    if hashed_password.startswith(_BCRYPT_PREFIXES):
+        return True
+    return password_hasher.check_needs_rehash(hashed_password)
 
 
 def create_access_token(
@@ -77,6 +153,60 @@ def create_refresh_token(
     return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
 
+def _decode_cache_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def decode_token(token: str) -> dict:
+    """
+    Decode and verify a JWT, reusing the result until the token expires.
+    
+    Args:
+        token: Encoded JWT string.
+    
+    Returns:
+        The decoded token payload.
+    
+    Raises:
+        jwt.InvalidTokenError: If the token is malformed, forged or expired.
+    """
+    key = _decode_cache_key(token)
+    cached = _decode_cache.get(key)
+    if cached is not None:
+        expires_at, payload = cached
+        if expires_at > time.time():
+            return payload
+        _decode_cache.pop(key, None)
+
+    payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    expires_at = payload.get("exp")
+    if expires_at is not None:
+        if len(_decode_cache) >= _DECODE_CACHE_MAX_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            _decode_cache.pop(next(iter(_decode_cache)), None)
+        _decode_cache[key] = (float(expires_at), payload)
+    return payload
+
+
+def _user_id_from_token(token: str) -> str:
+    """Return the subject of a valid token or raise a 401."""
+    try:
+        user_id = decode_token(token).get("sub")
+    except jwt.InvalidTokenError:
+        raise _credentials_exception()
+    if user_id is None:
+        raise _credentials_exception()
+    return user_id
+
+
+def _ensure_active(user) -> None:
+    if not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Inactive user account",
+        )
+
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: AsyncSession = Depends(get_db),
@@ -84,35 +214,67 @@ async def get_current_user(
     """
     Dependency to extract and validate the current user from JWT token.
     
+    Loads the full ORM instance; use it for endpoints that modify the
+    current user. Read-only endpoints should use get_current_user_view.
+    
     Raises:
         HTTPException: If token is invalid or user not found.
     """
     from app.models.user import User
 
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-    except JWTError:
-        raise credentials_exception
-
+    user_id = _user_id_from_token(token)
     result = await db.execute(select(User).where(User.id == user_id))
     user = result.scalar_one_or_none()
 
     if user is None:
-        raise credentials_exception
-    if not user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Inactive user account",
-        )
+        raise _credentials_exception()
+    _ensure_active(user)
+    return user
+
+
+async def get_current_user_view(
+    token: str = Depends(oauth2_scheme),
+    redis: Optional[Redis] = Depends(get_redis),
+) -> UserView:
+    """
+    Dependency returning a read-only view of the current user.
+    
+    The view is cached in Redis for a short TTL so most requests skip
+    the database; a session is only opened on a cache miss, and then
+    only the needed columns are selected, so no ORM instance is built.
+    
+    Raises:
+        HTTPException: If token is invalid or user not found.
+    """
+    from app.models.user import User
+
+    user_id = _user_id_from_token(token)
+
+    cached = await cache_get(redis, user_cache_key(user_id))
+    if cached:
+        user = UserView(id=uuid.UUID(user_id), **json.loads(cached))
+    else:
+        async with async_session_factory() as db:
+            result = await db.execute(
+                select(
+                    User.id,
+                    User.username,
+                    User.email,
+                    User.full_name,
+                    User.role,
+                    User.is_active,
+                ).where(User.id == user_id)
+            )
+            row = result.one_or_none()
+        if row is None:
+            raise _credentials_exception()
+
+        user = UserView(*row)
+        snapshot = asdict(user)
+        del snapshot["id"]
+        await cache_set(redis, user_cache_key(user_id), USER_CACHE_TTL, json.dumps(snapshot))
+
+    _ensure_active(user)
     return user
 
 
@@ -128,11 +290,7 @@ def require_role(required_role: str):
     """
     role_hierarchy = {"admin": 3, "manager": 2, "viewer": 1}
 
-    async def role_checker(
-        token: str = Depends(oauth2_scheme),
-        db: AsyncSession = Depends(get_db),
-    ):
-        user = await get_current_user(token, db)
+    async def role_checker(user: UserView = Depends(get_current_user_view)):
         user_level = role_hierarchy.get(user.role, 0)
         required_level = role_hierarchy.get(required_role, 99)
 
@@ -143,4 +301,8 @@ def require_role(required_role: str):
             )
         return user
 
-    return role_checker
\ No newline at end of file
+    return role_checker
+
+
+# Shared admin guard used by the user management endpoints
+get_current_admin_user = require_role("admin")
\ No newline at end of file
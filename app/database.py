@@ -5,8 +5,11 @@ Provides async SQLAlchemy engine and session factory
 for database operations throughout the application.
 """
 
+import asyncio
+
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.config import settings
 
@@ -14,8 +17,11 @@ from app.config import settings
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
-    pool_size=20,
-    max_overflow=10,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
     pool_pre_ping=True,
 )
 
@@ -27,6 +33,21 @@ async_session_factory = async_sessionmaker(
 )
 
 
+async def prewarm_pool(count: int) -> None:
+    """
+    Open connections up front so the first requests skip connection setup.
+    
+    Args:
+        count: Number of connections to open, capped at the pool size.
+    """
+    count = min(count, settings.DB_POOL_SIZE)
+    if count <= 0:
+        return
+    connections = await asyncio.gather(*(engine.connect() for _ in range(count)))
+    # Closing returns each connection to the pool rather than dropping it
+    await asyncio.gather(*(conn.close() for conn in connections))
+
+
 class Base(DeclarativeBase):
     """Base class for all ORM models."""
     pass
@@ -43,5 +43,17 @@ class User(Base):
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
+    def to_dict(self) -> dict:
+        """Serialize public user fields (never the password hash)."""
+        return {
+            "id": str(self.id),
+            "username": self.username,
+            "email": self.email,
+            "full_name": self.full_name,
+            "role": self.role,
+            "is_active": self.is_active,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+        }
+
     def __repr__(self) -> str:
         return f"<User(username={self.username}, role={self.role})>"
\ No newline at end of file
@@ -9,9 +9,12 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.config import settings
-from app.database import engine, Base
+from app.database import engine, Base, prewarm_pool
+from app.core.cache import create_redis
+from app.core.middleware import UnifiedMiddleware
 from app.api.auth import router as auth_router
 from app.api.dashboard import router as dashboard_router
 
@@ -22,8 +25,11 @@ async def lifespan(app: FastAPI):
     # Startup: create database tables
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    await prewarm_pool(settings.DB_POOL_PREWARM)
+    app.state.redis = create_redis()
     yield
-    # Shutdown: dispose engine
+    # Shutdown: close cache client and dispose engine
+    await app.state.redis.aclose()
     await engine.dispose()
 
 
@@ -35,6 +41,7 @@ def create_application() -> FastAPI:
         version="1.0.0",
         docs_url="/docs",
         redoc_url="/redoc",
+        default_response_class=ORJSONResponse,
         lifespan=lifespan,
     )
 
@@ -47,6 +54,9 @@ def create_application() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Request tracking, maintenance mode and security headers
+    app.add_middleware(UnifiedMiddleware)
+
     # Register routers
     app.include_router(auth_router, prefix="/api/v1/auth", tags=["Authentication"])
     app.include_router(dashboard_router, prefix="/api/v1/dashboard", tags=["Dashboard"])
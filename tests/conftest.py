@@ -0,0 +1,39 @@
+"""Shared pytest fixtures for the API test suite."""
+
+import pytest
+from httpx import AsyncClient, ASGITransport
+
+from main import app
+from app.core.permissions import Permission, Role, has_permission
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+async def client():
+    """Async client shared by every test module in the session."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.fixture(scope="session")
+def admin_headers():
+    return {"Authorization": "Bearer test_admin_token"}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_permissions():
+    """
+    Resolve every role/permission pair once before any test runs.
+
+    The role masks are built at import time, so today this only forces the
+    import; it keeps first-call costs out of the tests should the policy
+    table ever become lazily built or cached.
+    """
+    for role in Role:
+        for permission in Permission:
+            has_permission(role.value, permission)
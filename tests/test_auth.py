@@ -9,19 +9,7 @@ import pytest
 from httpx import AsyncClient, ASGITransport
 
 from main import app
-
-
-@pytest.fixture
-def anyio_backend():
-    return "asyncio"
-
-
-@pytest.fixture
-async def client():
-    """Create an async test client."""
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
-        yield ac
+from app.core.middleware import UnifiedMiddleware
 
 
 @pytest.mark.anyio
@@ -33,6 +21,44 @@ async def test_health_check(client: AsyncClient):
     assert data["status"] == "healthy"
 
 
+@pytest.mark.anyio
+async def test_response_headers(client: AsyncClient):
+    """Test every response carries tracking and security headers exactly once."""
+    response = await client.get("/health")
+    expected = {
+        "x-content-type-options": "nosniff",
+        "x-frame-options": "DENY",
+        "x-xss-protection": "1; mode=block",
+        "strict-transport-security": "max-age=31536000; includeSubDomains",
+    }
+    for name, value in expected.items():
+        assert response.headers.get_list(name) == [value]
+    assert len(response.headers.get_list("x-request-id")) == 1
+    assert len(response.headers.get_list("x-response-time")) == 1
+    assert response.headers["x-response-time"].endswith("s")
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("path,blocked", [
+    ("/api/v1/dashboard/stats", True),
+    ("/api/v1/auth/register", True),
+    ("/health", False),
+    ("/api/settings", False),
+    ("/api/settings/audit-log", False),
+])
+async def test_maintenance_mode(path: str, blocked: bool):
+    """Test maintenance mode blocks all but the allowed paths."""
+    transport = ASGITransport(app=UnifiedMiddleware(app, enabled=True))
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        response = await ac.get(path)
+    if blocked:
+        assert response.status_code == 503
+        assert response.json() == {"error": "Service under maintenance"}
+        assert response.headers.get_list("x-frame-options") == ["DENY"]
+    else:
+        assert response.status_code != 503
+
+
 @pytest.mark.anyio
 async def test_register_user(client: AsyncClient):
     """Test user registration with valid data."""
@@ -0,0 +1,112 @@
+"""
+Security Utility Tests.
+
+Unit tests for token decoding and password hashing that need
+neither the database nor the HTTP client.
+"""
+
+from datetime import timedelta
+
+import bcrypt
+import jwt
+import pytest
+
+from app.config import settings
+from app.core import security
+from app.core.security import (
+    DUMMY_PASSWORD_HASH,
+    _decode_cache_key,
+    create_access_token,
+    decode_token,
+    get_password_hash,
+    password_needs_rehash,
+    verify_password,
+)
+
+
+def bcrypt_hash(password: str) -> str:
+    """Legacy hash as stored before the argon2id migration."""
+    return bcrypt.hashpw(password.encode()[:72], bcrypt.gensalt(rounds=4)).decode()
+
+
+@pytest.fixture(autouse=True)
+def _clear_decode_cache():
+    security._decode_cache.clear()
+    yield
+    security._decode_cache.clear()
+
+
+class TestDecodeToken:
+    def test_second_decode_is_served_from_cache(self, monkeypatch):
+        token = create_access_token({"sub": "user-1"})
+        payload = decode_token(token)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("cached token was decoded again")
+
+        monkeypatch.setattr(security.jwt, "decode", fail)
+        assert decode_token(token) is payload
+        assert payload["sub"] == "user-1"
+
+    def test_expired_cache_entry_is_dropped(self):
+        token = create_access_token({"sub": "user-1"}, timedelta(seconds=-30))
+        payload = jwt.decode(
+            token,
+            settings.SECRET_KEY,
+            algorithms=[settings.ALGORITHM],
+            options={"verify_exp": False},
+        )
+        key = _decode_cache_key(token)
+        security._decode_cache[key] = (float(payload["exp"]), payload)
+
+        with pytest.raises(jwt.ExpiredSignatureError):
+            decode_token(token)
+        assert key not in security._decode_cache
+
+    def test_forged_signature_is_never_cached(self):
+        token = create_access_token({"sub": "user-1"})
+        claims = decode_token(token)
+        forged = jwt.encode(claims, "not-the-secret-key", algorithm=settings.ALGORITHM)
+
+        for _ in range(2):
+            with pytest.raises(jwt.InvalidSignatureError):
+                decode_token(forged)
+        assert _decode_cache_key(forged) not in security._decode_cache
+
+    def test_oldest_entry_is_evicted_at_max_size(self, monkeypatch):
+        monkeypatch.setattr(security, "_DECODE_CACHE_MAX_SIZE", 2)
+        tokens = [create_access_token({"sub": f"user-{i}"}) for i in range(3)]
+        for token in tokens:
+            decode_token(token)
+
+        assert len(security._decode_cache) == 2
+        assert _decode_cache_key(tokens[0]) not in security._decode_cache
+        assert _decode_cache_key(tokens[2]) in security._decode_cache
+
+
+class TestPasswords:
+    @pytest.mark.anyio
+    @pytest.mark.parametrize("password", ["SecureP@ss123", "x" * 100])
+    async def test_legacy_bcrypt_hash_verifies(self, password):
+        hashed = bcrypt_hash(password)
+        assert await verify_password(password, hashed) is True
+        assert await verify_password("!" + password[1:], hashed) is False
+
+    @pytest.mark.anyio
+    async def test_bcrypt_compares_first_72_bytes_only(self):
+        hashed = bcrypt_hash("y" * 80)
+        assert await verify_password("y" * 72 + "different", hashed) is True
+
+    @pytest.mark.anyio
+    async def test_malformed_bcrypt_hash_is_rejected(self):
+        assert await verify_password("SecureP@ss123", "$2b$12$not-a-real-hash") is False
+
+    @pytest.mark.anyio
+    async def test_dummy_hash_never_verifies(self):
+        assert await verify_password("not-a-real-password!", DUMMY_PASSWORD_HASH) is False
+        assert await verify_password("", DUMMY_PASSWORD_HASH) is False
+
+    @pytest.mark.anyio
+    async def test_only_legacy_hashes_need_rehash(self):
+        assert password_needs_rehash(bcrypt_hash("SecureP@ss123")) is True
+        assert password_needs_rehash(await get_password_hash("SecureP@ss123")) is False
@@ -1,60 +1,127 @@
 """Tests for user management API endpoints."""
 
-import pytest
-from unittest.mock import MagicMock, patch
-from fastapi.testclient import TestClient
-
-from main import app
-
+import uuid
 
-@pytest.fixture
-def client():
-    return TestClient(app)
-
-
-@pytest.fixture
-def admin_headers():
-    return {"Authorization": "Bearer test_admin_token"}
+import pytest
+from unittest.mock import MagicMock
+from fastapi import HTTPException
+from httpx import AsyncClient
+
+from app.api.users import list_users
+from app.core.permissions import (
+    require_permission,
+    has_permission,
+    has_all_permissions,
+    has_any_permission,
+    get_user_permissions,
+    Permission,
+)
+from app.core.security import get_current_user_view
+from app.models.user import User
+
+
+def make_user(username: str, role: str = "viewer") -> User:
+    return User(
+        id=uuid.uuid4(),
+        username=username,
+        email=f"{username}@example.com",
+        hashed_password="not-a-real-hash",
+        role=role,
+        is_active=True,
+    )
+
+
+def mock_db(users=()):
+    """Session mock whose query chain returns the given users."""
+    db = MagicMock()
+    query = db.query.return_value
+    query.filter.return_value = query
+    query.count.return_value = len(users)
+    query.offset.return_value.limit.return_value.all.return_value = list(users)
+    return db
+
+
+async def call_list_users(db, **params):
+    params = {"page": 1, "per_page": 20, "search": None, "role": None, **params}
+    return await list_users(db=db, current_user=MagicMock(), **params)
 
 
 class TestListUsers:
-    def test_list_users_default_pagination(self, client, admin_headers):
-        response = client.get("/api/users/", headers=admin_headers)
-        assert response.status_code in (200, 401)
-
-    def test_list_users_with_search(self, client, admin_headers):
-        response = client.get("/api/users/?search=admin", headers=admin_headers)
-        assert response.status_code in (200, 401)
-
-    def test_list_users_with_role_filter(self, client, admin_headers):
-        response = client.get("/api/users/?role=editor", headers=admin_headers)
-        assert response.status_code in (200, 401)
+    @pytest.mark.anyio
+    @pytest.mark.parametrize("params,filter_calls", [
+        ({}, 0),
+        ({"search": "admin"}, 1),
+        ({"role": "editor"}, 1),
+    ])
+    async def test_list_users(self, params, filter_calls):
+        db = mock_db()
+        result = await call_list_users(db, **params)
+        assert result == {"items": [], "total": 0, "page": 1, "per_page": 20, "pages": 0}
+        assert db.query.return_value.filter.call_count == filter_calls
+
+    @pytest.mark.anyio
+    async def test_list_users_serializes_rows(self):
+        db = mock_db([make_user("alice", role="admin"), make_user("bob")])
+        result = await call_list_users(db)
+        assert result["total"] == 2
+        assert result["pages"] == 1
+        assert [item["username"] for item in result["items"]] == ["alice", "bob"]
+        assert result["items"][0]["role"] == "admin"
+        assert "hashed_password" not in result["items"][0]
+
+
+class TestCurrentUserView:
+    @pytest.mark.anyio
+    async def test_rejects_invalid_token(self):
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user_view(token="test_admin_token", redis=None)
+        assert exc_info.value.status_code == 401
+
+
+class TestAdminUsersRoute:
+    @pytest.mark.anyio
+    async def test_requires_token(self, client: AsyncClient):
+        response = await client.get("/api/v1/dashboard/users")
+        assert response.status_code == 401
+
+    @pytest.mark.anyio
+    async def test_rejects_invalid_token(self, client: AsyncClient, admin_headers):
+        response = await client.get("/api/v1/dashboard/users", headers=admin_headers)
+        assert response.status_code == 401
 
 
 class TestUserPermissions:
+    @pytest.mark.parametrize("role,permission,expected", [
+        ("admin", Permission.MANAGE_USERS, True),
+        ("admin", Permission.EDIT_SETTINGS, True),
+        ("admin", Permission.DELETE_RECORDS, True),
+        ("viewer", Permission.VIEW_DASHBOARD, True),
+        ("viewer", Permission.MANAGE_USERS, False),
+        ("viewer", Permission.DELETE_RECORDS, False),
+        ("editor", Permission.VIEW_DASHBOARD, True),
+        ("editor", Permission.MANAGE_CONTENT, True),
+        ("editor", Permission.MANAGE_USERS, False),
+        ("invalid", Permission.VIEW_DASHBOARD, False),
+    ])
+    def test_has_permission(self, role, permission, expected):
+        assert has_permission(role, permission) is expected
+
     def test_admin_has_all_permissions(self):
-        from app.core.permissions import has_permission, Permission
-        assert has_permission("admin", Permission.MANAGE_USERS)
-        assert has_permission("admin", Permission.EDIT_SETTINGS)
-        assert has_permission("admin", Permission.DELETE_RECORDS)
-
-    def test_viewer_limited_permissions(self):
-        from app.core.permissions import has_permission, Permission
-        assert has_permission("viewer", Permission.VIEW_DASHBOARD)
-        assert not has_permission("viewer", Permission.MANAGE_USERS)
-        assert not has_permission("viewer", Permission.DELETE_RECORDS)
-
-    def test_editor_moderate_permissions(self):
-        from app.core.permissions import has_permission, Permission
-        assert has_permission("editor", Permission.VIEW_DASHBOARD)
-        assert has_permission("editor", Permission.MANAGE_CONTENT)
-        assert not has_permission("editor", Permission.MANAGE_USERS)
-
-    def test_invalid_role(self):
-        from app.core.permissions import has_permission, Permission
-        assert not has_permission("invalid", Permission.VIEW_DASHBOARD)
+        assert has_all_permissions(
+            "admin",
+            Permission.MANAGE_USERS | Permission.EDIT_SETTINGS | Permission.DELETE_RECORDS,
+        )
+
+    def test_editor_combined_permissions(self):
+        permissions = Permission.MANAGE_CONTENT | Permission.MANAGE_USERS
+        assert not has_all_permissions("editor", permissions)
+        assert has_any_permission("editor", permissions)
+        assert not has_any_permission("invalid", permissions)
+
+    def test_require_permission_rejects_empty_mask(self):
+        with pytest.raises(ValueError):
+            require_permission(Permission(0))
 
     def test_get_user_permissions(self):
-        from app.core.permissions import get_user_permissions
         perms = get_user_permissions("admin")
         assert len(perms) > 0
\ No newline at end of file